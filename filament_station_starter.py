@@ -17,23 +17,31 @@ Base features:
 import os
 import sys
 import json
+import pickle
 import time
 import queue
 import sqlite3
 import threading
+import multiprocessing
+import subprocess
 import webbrowser
 from datetime import datetime
 
 # --- UI ---
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog, font as tkfont
 
 # --- Camera / QR ---
 try:
     import cv2
-    from pyzbar import pyzbar
+    import numpy as np
 except Exception:
     cv2 = None
+    np = None
+# pyzbar is only a fallback decoder for cv2 builds without the QR module.
+try:
+    from pyzbar import pyzbar
+except Exception:
     pyzbar = None
 
 DB_PATH = os.environ.get("FS_DB_PATH", os.path.expanduser("~/.filament_station/filaments.db"))
@@ -65,12 +73,30 @@ DEFAULT_CONFIG = {
 
 def load_config():
     if os.path.exists(CONF_PATH):
+        # Warm boots skip JSON parsing and the per-key merge: the merged
+        # config is cached in a pickle keyed on config.json's mtime, which
+        # matters on SD-card reads during kiosk startup.
+        pkl_path = CONF_PATH + ".pkl"
+        mtime = os.path.getmtime(CONF_PATH)
+        try:
+            with open(pkl_path, "rb") as f:
+                cached_mtime, merged = pickle.load(f)
+            if cached_mtime == mtime:
+                return merged
+        except Exception:
+            pass
         try:
             with open(CONF_PATH, "r") as f:
                 cfg = json.load(f)
             merged = DEFAULT_CONFIG.copy()
             for k, v in cfg.items():
                 merged[k] = v
+            merged["_loc_by_qr"] = {l["qr"]: l["name"] for l in merged.get("locations", [])}
+            try:
+                with open(pkl_path, "wb") as f:
+                    pickle.dump((mtime, merged), f)
+            except Exception:
+                pass
             return merged
         except Exception:
             pass
@@ -79,17 +105,78 @@ def load_config():
         os.makedirs(os.path.dirname(CONF_PATH), exist_ok=True)
         with open(CONF_PATH, "w") as f:
             json.dump(DEFAULT_CONFIG, f, indent=2)
-    return DEFAULT_CONFIG
+    cfg = DEFAULT_CONFIG.copy()
+    cfg["_loc_by_qr"] = {l["qr"]: l["name"] for l in cfg.get("locations", [])}
+    return cfg
 
 CFG = load_config()
+# Frozen at import so the per-frame lookup is a single dict hit.
+_LOC_BY_QR = CFG["_loc_by_qr"]
+# CFG never changes after load; hoist the hot-path values to constants.
+PAIR_WINDOW = float(CFG.get("pair_window_seconds", 10))
+SCAN_INTERVAL_MS = int(CFG["scan_interval_ms"])
+CAMERA_INDEX = int(CFG["camera_index"])
 
 # --------------------
 # Database helpers
 # --------------------
+# One long-lived connection for the whole process. Opening/closing a
+# connection per call throws away SQLite's page cache and adds syscall
+# overhead on every scan; WAL + NORMAL sync keeps commits cheap on SD cards.
+_CONN = None
+_DB_LOCK = threading.Lock()
+
+# Hot-path SQL hoisted to constants so sqlite3's statement cache always
+# sees the same string object and skips re-parsing/re-planning.
+SQL_GET_SPOOL = "SELECT * FROM spools WHERE url = ?"
+SQL_UPSERT_SPOOL = """
+    INSERT INTO spools (url, name, material, color)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(url) DO UPDATE SET
+        name = COALESCE(excluded.name, name),
+        material = COALESCE(excluded.material, material),
+        color = COALESCE(excluded.color, color)
+    RETURNING id
+"""
+SQL_UPDATE_WEIGHT = "UPDATE spools SET last_weight_g = ?, last_updated = ? WHERE id = ?"
+SQL_INSERT_LOG_WEIGH = "INSERT INTO logs (spool_id, timestamp, action, weight_g) VALUES (?, ?, 'weigh', ?)"
+SQL_UPDATE_LOCATION = "UPDATE spools SET location = ?, last_updated = ? WHERE id = ?"
+SQL_INSERT_LOG_MOVE = "INSERT INTO logs (spool_id, timestamp, action, location) VALUES (?, ?, 'move', ?)"
+SQL_INSERT_LOG_GENERIC = """
+    INSERT INTO logs (spool_id, timestamp, action, weight_g, location, note)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
 def get_db():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    global _CONN
+    if _CONN is None:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None,
+                               cached_statements=128)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        _CONN = conn
+    return _CONN
+
+def _exec(sql, params=()):
+    """Run one statement on the shared connection under the DB lock."""
+    with _DB_LOCK:
+        return get_db().execute(sql, params)
+
+def _exec_txn(statements):
+    """Run several (sql, params) pairs atomically in one transaction."""
+    with _DB_LOCK:
+        conn = get_db()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for sql, params in statements:
+                conn.execute(sql, params)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
 
 def init_db():
     conn = get_db()
@@ -103,14 +190,14 @@ def init_db():
         color TEXT,
         location TEXT,
         last_weight_g REAL,
-        last_updated TEXT
+        last_updated INTEGER
     );
     """)
     cur.execute("""
     CREATE TABLE IF NOT EXISTS logs (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         spool_id INTEGER,
-        timestamp TEXT,
+        timestamp INTEGER,
         action TEXT,
         weight_g REAL,
         location TEXT,
@@ -118,63 +205,38 @@ def init_db():
         FOREIGN KEY(spool_id) REFERENCES spools(id) ON DELETE CASCADE
     );
     """)
-    conn.commit()
-    conn.close()
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_logs_spool_id ON logs(spool_id);")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_logs_ts ON logs(timestamp);")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_spools_location ON spools(location);")
 
 def upsert_spool(url, name=None, material=None, color=None):
-    conn = get_db()
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM spools WHERE url = ?", (url,))
-    row = cur.fetchone()
-    if row is None:
-        cur.execute("""
-            INSERT INTO spools (url, name, material, color, location, last_weight_g, last_updated)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (url, name, material, color, None, None, None))
-        conn.commit()
-        spool_id = cur.lastrowid
-    else:
-        spool_id = row["id"]
-        if any([name, material, color]):
-            cur.execute("""
-                UPDATE spools SET name = COALESCE(?, name),
-                                  material = COALESCE(?, material),
-                                  color = COALESCE(?, color)
-                WHERE id = ?
-            """, (name, material, color, spool_id))
-            conn.commit()
-    conn.close()
-    return spool_id
+    # One UPSERT covers both the new-spool and existing-spool paths and
+    # hands back the id without a separate SELECT.
+    return _exec(SQL_UPSERT_SPOOL, (url, name, material, color)).fetchone()[0]
 
 def get_spool_by_url(url):
-    conn = get_db()
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM spools WHERE url = ?", (url,))
-    row = cur.fetchone()
-    conn.close()
-    return row
+    return _exec(SQL_GET_SPOOL, (url,)).fetchone()
 
 def update_weight(spool_id, weight_g):
-    ts = datetime.utcnow().isoformat()
-    conn = get_db()
-    cur = conn.cursor()
-    cur.execute("UPDATE spools SET last_weight_g = ?, last_updated = ? WHERE id = ?",
-                (weight_g, ts, spool_id))
-    cur.execute("INSERT INTO logs (spool_id, timestamp, action, weight_g) VALUES (?, ?, 'weigh', ?)",
-                (spool_id, ts, weight_g))
-    conn.commit()
-    conn.close()
+    """Record a new weight; returns the timestamp written so callers can
+    patch their cached spool row without re-selecting it.
+
+    Timestamps are stored as integer Unix epoch seconds and only formatted
+    when rendered; building an ISO string per write is wasted work here.
+    """
+    ts = int(time.time())
+    # Spool update + log row are one atomic event: commit them together
+    # so each weigh costs a single disk sync instead of two.
+    _exec_txn([(SQL_UPDATE_WEIGHT, (weight_g, ts, spool_id)),
+               (SQL_INSERT_LOG_WEIGH, (spool_id, ts, weight_g))])
+    return ts
 
 def update_location(spool_id, location):
-    ts = datetime.utcnow().isoformat()
-    conn = get_db()
-    cur = conn.cursor()
-    cur.execute("UPDATE spools SET location = ?, last_updated = ? WHERE id = ?",
-                (location, ts, spool_id))
-    cur.execute("INSERT INTO logs (spool_id, timestamp, action, location) VALUES (?, ?, 'move', ?)",
-                (spool_id, ts, location))
-    conn.commit()
-    conn.close()
+    """Record a move; returns the timestamp written (see update_weight)."""
+    ts = int(time.time())
+    _exec_txn([(SQL_UPDATE_LOCATION, (location, ts, spool_id)),
+               (SQL_INSERT_LOG_MOVE, (spool_id, ts, location))])
+    return ts
 
 # --------------------
 # QR helpers
@@ -183,61 +245,167 @@ def classify_qr_payload(payload: str):
     """Return ('location', name) if payload matches a configured location QR;
        else ('spool', payload).
     """
-    for loc in CFG.get("locations", []):
-        if payload == loc.get("qr"):
-            return ("location", loc.get("name"))
-    return ("spool", payload)
+    name = _LOC_BY_QR.get(payload)
+    return ("location", name) if name else ("spool", payload)
 
 # --------------------
-# QR Scanning thread
+# QR Scanning process
 # --------------------
-class QRScanner(threading.Thread):
+class QRScanner(multiprocessing.Process):
+    """Camera capture + QR decode in a separate process.
+
+    cv2/zbar work never contends with the Tk event loop for the GIL or the
+    Pi's single busy core; only the decoded strings cross the queue.
+    """
     def __init__(self, camera_index=0, interval_ms=250, out_queue=None):
         super().__init__(daemon=True)
         self.camera_index = camera_index
         self.interval = interval_ms / 1000.0
-        self.q = out_queue or queue.Queue()
-        self._stop = threading.Event()
+        self.q = out_queue or multiprocessing.Queue()
+        self._stop = multiprocessing.Event()
         self.cap = None
+        self._qr = None  # cv2.QRCodeDetector, built in run()
+        self._clahe = None  # built lazily; cv2 may be unavailable
+        # Preallocated gray planes, sized on the first frame (see run()).
+        self._buf_a = None
+        self._buf_b = None
+        self._gray_full = None
 
     def run(self):
-        if cv2 is None or pyzbar is None:
-            self.q.put(("error", "Missing OpenCV/pyzbar. Install deps."))
+        if cv2 is None:
+            self.q.put(("error", "Missing OpenCV. Install deps."))
+            return
+        try:
+            # Direct C++ decode path: the Mat stays in place instead of
+            # being marshaled through ctypes into zbar.
+            self._qr = cv2.QRCodeDetector()
+        except Exception:
+            self._qr = None
+        if self._qr is None and pyzbar is None:
+            self.q.put(("error", "Missing OpenCV QR module/pyzbar. Install deps."))
             return
         src = CFG.get("camera_url")
         self.cap = cv2.VideoCapture(src if src else self.camera_index)
         if not self.cap.isOpened():
             self.q.put(("error", f"Cannot open camera index {self.camera_index}"))
             return
-        last_val = None
-        same_count = 0
+        # Keep the driver buffer shallow and prefer MJPG so grab() stays cheap.
+        try:
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+            # 640x480 is plenty for QR at arm's length; a smaller sensor
+            # frame makes every later step (retrieve, gray, decode) cheaper.
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        except Exception:
+            pass
+        last_decode = 0.0
+        prev_gray = None
+        last_emit_val = None
+        last_emit_ts = 0.0
         while not self._stop.is_set():
-            ret, frame = self.cap.read()
-            if not ret:
+            # grab() advances the stream without decoding the frame; we only
+            # pay for retrieve() + QR decode once per scan interval, letting
+            # the camera's intermediate frames drop for free.
+            if not self.cap.grab():
                 time.sleep(self.interval)
                 continue
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            codes = pyzbar.decode(gray)
-            if codes:
-                data = codes[0].data.decode("utf-8").strip()
-                if data == last_val:
-                    same_count += 1
-                else:
-                    last_val = data
-                    same_count = 1
-                if same_count >= 2:
+            now = time.monotonic()
+            if now - last_decode < self.interval:
+                continue
+            last_decode = now
+            ret, frame = self.cap.retrieve()
+            if not ret:
+                continue
+            h, w = frame.shape[:2]
+            # If the camera ignored the 640x480 request, downscale before
+            # decoding; zbar's cost is roughly linear in pixel count.
+            scale = max(1, min(w, h) // 480)
+            dh, dw = h // scale, w // scale
+            # Write into a pair of preallocated gray planes instead of
+            # letting cvtColor/resize allocate a fresh array every frame.
+            # The pair alternates so prev_gray still points at the last
+            # frame's pixels for the motion-quiet check below.
+            if self._buf_a is None or self._buf_a.shape != (dh, dw):
+                self._buf_a = np.empty((dh, dw), dtype=np.uint8)
+                self._buf_b = np.empty((dh, dw), dtype=np.uint8)
+                self._gray_full = np.empty((h, w), dtype=np.uint8) if scale > 1 else None
+                prev_gray = None
+            else:
+                self._buf_a, self._buf_b = self._buf_b, self._buf_a
+            if scale > 1:
+                cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_full)
+                cv2.resize(self._gray_full, (dw, dh), dst=self._buf_a,
+                           interpolation=cv2.INTER_AREA)
+            else:
+                cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._buf_a)
+            gray = self._buf_a
+            data = self._decode(gray)
+            if data is None and prev_gray is not None and prev_gray.shape == gray.shape:
+                # Only spend extra CPU on hard frames when the scene is still;
+                # a moving frame will be replaced by a sharper one shortly.
+                if cv2.absdiff(gray, prev_gray).mean() < 4.0:
+                    data = self._enhance_and_retry(gray)
+            prev_gray = gray
+            if data:
+                # Timestamp-gated debounce: the same payload is
+                # suppressed for 1 s, but a different QR (spool then
+                # location in the pair window) passes immediately and
+                # the loop never blocks, so _stop stays responsive.
+                if data != last_emit_val or now - last_emit_ts >= 1.0:
                     self.q.put(("qr", data))
-                    time.sleep(1.0)  # debounce
-            time.sleep(self.interval)
-
-    def stop(self):
-        self._stop.set()
+                    last_emit_val = data
+                    last_emit_ts = now
+        # The capture lives in this process; release it here on shutdown.
         try:
-            if self.cap:
-                self.cap.release()
+            self.cap.release()
         except Exception:
             pass
 
+    def _decode(self, gray):
+        """Decode one QR payload from a gray frame, or return None.
+
+        Both decoders validate the Reed-Solomon checksum, so a single good
+        read is trustworthy. Prefers cv2's detector; falls back to pyzbar
+        when the cv2 build lacks the QR module.
+        """
+        if self._qr is not None:
+            try:
+                ok, decoded, _, _ = self._qr.detectAndDecodeMulti(gray)
+            except cv2.error:
+                ok, decoded = False, ()
+            if ok:
+                for text in decoded:
+                    if text:
+                        return text.strip()
+            return None
+        for code in pyzbar.decode(gray):
+            if code.type == "QRCODE":
+                return code.data.decode("utf-8").strip()
+        return None
+
+    def _enhance_and_retry(self, gray):
+        """Progressively more expensive preprocessing for frames the decoder
+        missed: invert, CLAHE, Otsu threshold, dilate. Returns the payload
+        from the first variant that decodes, else None.
+        """
+        data = self._decode(cv2.bitwise_not(gray))
+        if data:
+            return data
+        if self._clahe is None:
+            self._clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        data = self._decode(self._clahe.apply(gray))
+        if data:
+            return data
+        _, otsu = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        data = self._decode(otsu)
+        if data:
+            return data
+        return self._decode(cv2.dilate(otsu, None))
+
+    def stop(self):
+        self._stop.set()
+
 # --------------------
 # UI
 # --------------------
@@ -254,15 +422,22 @@ class App(tk.Tk):
 
         self.style = ttk.Style(self)
         self.style.theme_use("clam")
-        self.style.configure("TLabel", background="#111", foreground="#eee", font=("DejaVu Sans", 12))
-        self.style.configure("Header.TLabel", font=("DejaVu Sans", 14, "bold"))
-        self.style.configure("TButton", font=("DejaVu Sans", 12))
+        # Create the fonts once so every widget shares the same Tk font
+        # handle instead of re-resolving "DejaVu Sans" from Xft per label.
+        self._font = tkfont.Font(family="DejaVu Sans", size=12)
+        self._header_font = tkfont.Font(family="DejaVu Sans", size=14, weight="bold")
+        self.style.configure("TLabel", background="#111", foreground="#eee", font=self._font)
+        self.style.configure("Header.TLabel", font=self._header_font)
+        self.style.configure("TButton", font=self._font)
 
         # State
         self.current_url = None
         self.current_spool = None
         self.last_spool_scan_ts = 0.0
         self.last_location_scan = None  # (name, ts)
+        # Static for the process; no need to rebuild per Move click.
+        self._move_choices = tuple(b["name"] for b in CFG.get("bins", [])) + \
+            ("AMS Slot 1", "AMS Slot 2", "AMS Slot 3", "AMS Slot 4", "Dryer", "Other")
 
         # UI
         self.lbl_title = ttk.Label(self, text="📦 Filament Station", style="Header.TLabel")
@@ -298,25 +473,34 @@ class App(tk.Tk):
         ttk.Button(man, text="Quit", command=self.on_quit).grid(row=0, column=2, padx=6)
 
         # QR scanner
-        self.q = queue.Queue()
-        self.scanner = QRScanner(camera_index=CFG["camera_index"],
-                                 interval_ms=CFG["scan_interval_ms"],
+        self.q = multiprocessing.Queue()
+        self._idle_polls = 0
+        self.scanner = QRScanner(camera_index=CAMERA_INDEX,
+                                 interval_ms=SCAN_INTERVAL_MS,
                                  out_queue=self.q)
         self.after(200, self.poll_q)
         self.scanner.start()
 
     # --- QR event loop ---
     def poll_q(self):
+        drained = False
         try:
             while True:
                 kind, payload = self.q.get_nowait()
+                drained = True
                 if kind == "error":
                     messagebox.showerror("QR Error", payload)
                 elif kind == "qr":
                     self.on_qr(payload)
         except queue.Empty:
             pass
-        self.after(200, self.poll_q)
+        # Poll fast for ~1 s after activity so the second half of a
+        # quick-pair lands promptly, then back off and let Tk idle.
+        if drained:
+            self._idle_polls = 0
+        else:
+            self._idle_polls += 1
+        self.after(100 if self._idle_polls < 10 else 500, self.poll_q)
 
     def on_qr(self, payload):
         qtype, value = classify_qr_payload(payload)
@@ -334,7 +518,8 @@ class App(tk.Tk):
             guess = url.rstrip("/").split("/")[-1].replace("-", " ").title()
             sid = upsert_spool(url, name=guess)
             spool = get_spool_by_url(url)
-        self.current_spool = spool
+        # Keep a plain dict so later writes can patch fields in place.
+        self.current_spool = dict(spool)
         self.last_spool_scan_ts = now
         self.refresh_labels()
         self.log_action("scan", note=f"Scanned spool: {url}")
@@ -343,7 +528,7 @@ class App(tk.Tk):
         # If a location was just scanned, pair it
         if self.last_location_scan:
             loc_name, loc_ts = self.last_location_scan
-            if (now - loc_ts) <= CFG.get("pair_window_seconds", 10):
+            if (now - loc_ts) <= PAIR_WINDOW:
                 self.apply_location_move(loc_name)
 
     def handle_location_scan(self, loc_name, now):
@@ -351,33 +536,28 @@ class App(tk.Tk):
         self.var_status.set(f"Location scanned: {loc_name}. (Scan spool to move.)")
 
         # If a spool was just scanned, pair it
-        if self.current_spool and (now - self.last_spool_scan_ts) <= CFG.get("pair_window_seconds", 10):
+        if self.current_spool and (now - self.last_spool_scan_ts) <= PAIR_WINDOW:
             self.apply_location_move(loc_name)
 
     def apply_location_move(self, loc_name):
         if not self.current_spool:
             return
-        update_location(self.current_spool["id"], loc_name)
-        self.current_spool = get_spool_by_url(self.current_spool["url"])
+        ts = update_location(self.current_spool["id"], loc_name)
+        # We know which columns changed; patch the cached row rather than
+        # re-selecting it.
+        self.current_spool = {**self.current_spool, "location": loc_name, "last_updated": ts}
         self.refresh_labels()
         self.var_status.set(f"✅ Moved to: {loc_name}")
-        self.log_action("move", location=loc_name)
+        # update_location already writes the 'move' log row
         # clear the last_location_scan to avoid repeated moves
         self.last_location_scan = None
 
     def log_action(self, action, weight_g=None, location=None, note=None):
         if not self.current_spool:
             return
-        conn = get_db()
-        cur = conn.cursor()
-        cur.execute("""
-            INSERT INTO logs (spool_id, timestamp, action, weight_g, location, note)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (self.current_spool["id"],
-              datetime.utcnow().isoformat(),
-              action, weight_g, location, note))
-        conn.commit()
-        conn.close()
+        _exec(SQL_INSERT_LOG_GENERIC,
+              (self.current_spool["id"], int(time.time()),
+               action, weight_g, location, note))
 
     def refresh_labels(self):
         s = self.current_spool
@@ -393,8 +573,12 @@ class App(tk.Tk):
         self.var_weight.set(f"Weight: {w:.0f} g" if w is not None else "Weight: -- g")
         loc = s["location"] or "--"
         self.var_loc.set(f"Location: {loc}")
-        last = s["last_updated"] or "--"
-        self.var_last.set(f"Updated: {last}")
+        last = s["last_updated"]
+        # New rows store epoch seconds (possibly coerced to a digit string by
+        # an old TEXT-typed DB); pre-existing ISO text renders as-is.
+        if isinstance(last, (int, float)) or (isinstance(last, str) and last.isdigit()):
+            last = datetime.fromtimestamp(int(last)).strftime("%Y-%m-%d %H:%M")
+        self.var_last.set(f"Updated: {last or '--'}")
 
     # --- Buttons ---
     def on_weigh(self):
@@ -405,8 +589,8 @@ class App(tk.Tk):
             val = simpledialog.askfloat("Weigh Spool", "Enter current weight (g):", minvalue=0.0, maxvalue=5000.0)
             if val is None:
                 return
-            update_weight(self.current_spool["id"], float(val))
-            self.current_spool = get_spool_by_url(self.current_spool["url"])
+            ts = update_weight(self.current_spool["id"], float(val))
+            self.current_spool = {**self.current_spool, "last_weight_g": float(val), "last_updated": ts}
             self.refresh_labels()
             self.var_status.set("Weight updated.")
         except Exception as e:
@@ -416,12 +600,11 @@ class App(tk.Tk):
         if not self.current_spool:
             messagebox.showinfo("No spool", "Scan a spool QR first.")
             return
-        choices = [b["name"] for b in CFG.get("bins", [])] + ["AMS Slot 1", "AMS Slot 2", "AMS Slot 3", "AMS Slot 4", "Dryer", "Other"]
-        dlg = ChoiceDialog(self, "Move To Location", "Select a new location:", choices)
+        dlg = ChoiceDialog(self, "Move To Location", "Select a new location:", self._move_choices)
         self.wait_window(dlg)
         if dlg.choice:
-            update_location(self.current_spool["id"], dlg.choice)
-            self.current_spool = get_spool_by_url(self.current_spool["url"])
+            ts = update_location(self.current_spool["id"], dlg.choice)
+            self.current_spool = {**self.current_spool, "location": dlg.choice, "last_updated": ts}
             self.refresh_labels()
             self.var_status.set(f"Moved to: {dlg.choice}")
 
@@ -431,10 +614,14 @@ class App(tk.Tk):
             return
         url = self.current_url
         browser_bin = CFG.get("browser")
-        from shutil import which
-        if browser_bin and which(browser_bin):
+        if browser_bin and shutil.which(browser_bin):
             try:
-                os.system(f"{browser_bin} '{url}' &")
+                # Direct fork/exec: no shell parse, no quoting pitfalls with
+                # scanned URLs, returns immediately.
+                subprocess.Popen([browser_bin, url], close_fds=True,
+                                 stdin=subprocess.DEVNULL,
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL)
                 return
             except Exception:
                 pass
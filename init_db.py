@@ -4,7 +4,10 @@ DB_PATH = os.environ.get("FS_DB_PATH", os.path.expanduser("~/.filament_station/f
 os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
 conn = sqlite3.connect(DB_PATH)
 cur = conn.cursor()
-cur.execute("CREATE TABLE IF NOT EXISTS spools (id INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT UNIQUE, name TEXT, material TEXT, color TEXT, location TEXT, last_weight_g REAL, last_updated TEXT);")
-cur.execute("CREATE TABLE IF NOT EXISTS logs (id INTEGER PRIMARY KEY AUTOINCREMENT, spool_id INTEGER, timestamp TEXT, action TEXT, weight_g REAL, location TEXT, note TEXT, FOREIGN KEY(spool_id) REFERENCES spools(id) ON DELETE CASCADE);")
+cur.execute("CREATE TABLE IF NOT EXISTS spools (id INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT UNIQUE, name TEXT, material TEXT, color TEXT, location TEXT, last_weight_g REAL, last_updated INTEGER);")
+cur.execute("CREATE TABLE IF NOT EXISTS logs (id INTEGER PRIMARY KEY AUTOINCREMENT, spool_id INTEGER, timestamp INTEGER, action TEXT, weight_g REAL, location TEXT, note TEXT, FOREIGN KEY(spool_id) REFERENCES spools(id) ON DELETE CASCADE);")
+cur.execute("CREATE INDEX IF NOT EXISTS idx_logs_spool_id ON logs(spool_id);")
+cur.execute("CREATE INDEX IF NOT EXISTS idx_logs_ts ON logs(timestamp);")
+cur.execute("CREATE INDEX IF NOT EXISTS idx_spools_location ON spools(location);")
 conn.commit(); conn.close()
 print(f'Initialized DB at: {DB_PATH}')